@@ -37,10 +37,10 @@ class LogHandler(StreamHandler):
     """Handler to integrate log messages with tqdm."""
 
     def emit(self, record):
-        # Write after flushing buffer to integrate with tqdm
+        # Write through tqdm to integrate with progress bars; this writes to
+        # stdout, not this handler's stream, so there is nothing to flush
         try:
             tqdm.write(self.format(record))
-            self.flush()
         except Exception:
             self.handleError(record)
 
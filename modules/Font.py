@@ -1,6 +1,5 @@
 from pathlib import Path
-from re import compile as re_compile
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from modules.BaseCardType import BaseCardType
 
 from modules import global_objects
@@ -23,15 +22,11 @@ class Font(YamlReader):
         'stroke_width',
     )
 
-    """Compiled regex to identify percentage values for scalars"""
-    _PERCENT_REGEX = re_compile(r'^-?\d+\.?\d*%$')
-    _PERCENT_REGEX_POSITIVE = re_compile(r'^\d+\.?\d*%$')
-
     __slots__ = (
         '__card_class', '__series_info', '__validator', '__validate', 'color',
-        'size', 'file', 'replacements', 'delete_missing', 'case_name', 'case',
-        'vertical_shift', 'interline_spacing', 'interword_spacing', 'kerning',
-        'stroke_width',
+        'size', 'file', '__replacements', '__translation_table',
+        'delete_missing', 'case_name', 'case', 'vertical_shift',
+        'interline_spacing', 'interword_spacing', 'kerning', 'stroke_width',
     )
 
 
@@ -72,6 +67,43 @@ class Font(YamlReader):
         return f'<Font for series "{self.__series_info}">'
 
 
+    @property
+    def replacements(self) -> dict[str, str]:
+        """Mapping of text to replace to its replacement"""
+
+        return self.__replacements
+
+
+    @replacements.setter
+    def replacements(self, replacements: dict[str, str]) -> None:
+        """
+        Set the replacements of this font. If all replacements are of
+        single characters, this also builds a translation table so they
+        can be applied in a single pass.
+
+        Args:
+            replacements: Mapping of text to replace to its replacement.
+        """
+
+        self.__replacements = replacements
+
+        # Multi-character (or empty) replacements must be applied in order
+        if not all(len(old) == 1 for old in replacements):
+            self.__translation_table = None
+            return None
+
+        # Translate each character to the result of applying every
+        # replacement in order - identical to applying them sequentially
+        translations = {}
+        for char in replacements:
+            translated = char
+            for old, new in replacements.items():
+                translated = translated.replace(old, new)
+            translations[char] = translated
+
+        self.__translation_table = str.maketrans(translations)
+
+
     @property
     def custom_hash(self) -> str:
         """Custom string to hash for this object for record keeping"""
@@ -107,91 +139,202 @@ class Font(YamlReader):
         self.valid = False
 
 
-    def __parse_attributes(self) -> None:
-        """Parse this object's YAML and update the validity and attributes."""
+    @staticmethod
+    def __parse_percentage(
+            value: str,
+            positive: bool = False,
+        ) -> Optional[float]:
+        """
+        Parse the given percentage string (e.g. "-12.5%") into a scalar.
 
-        # Whether to validate for this font
-        if (value := self.get('validate', type_=bool)) is not None:
-            self.__validate = value
-
-        # Case
-        if (value := self.get('case', type_=self.TYPE_LOWER_STR)) is not None:
-            if value in self.__card_class.CASE_FUNCTIONS:
-                self.case_name = value
-                self.case = self.__card_class.CASE_FUNCTIONS[value]
-            else:
-                self.__error('case', value, 'unrecognized value')
-
-        # Color
-        if (value := self.get('color', type_=str)) is not None:
-            self.color = value
-
-        # File
-        if (value := self.get('file', type_=Path)) is not None:
-            # If specified as direct path, check for existance
-            if value.exists():
-                self.file = str(value.resolve())
+        Args:
+            value: Percentage string to parse.
+            positive: Whether the percentage must be positive.
+
+        Returns:
+            The scalar value of the percentage (e.g. -0.125), None if
+            the given string is not a valid percentage.
+        """
+
+        if not value.endswith('%'):
+            return None
+
+        # Strip trailing % and leading - (if permitted)
+        number = value[:-1]
+        digits = number[1:] if not positive and number[:1] == '-' else number
+
+        # Must start with a digit, and contain at most one decimal point
+        if (not digits[:1].isdecimal()
+            or not digits.replace('.', '', 1).isdecimal()):
+            return None
+
+        return float(number) / 100.0
+
+
+    def __parse_validate(self, value: bool) -> None:
+        """Parse the 'validate' YAML attribute."""
+
+        self.__validate = value
+
+
+    def __parse_case(self, value: str) -> None:
+        """Parse the 'case' YAML attribute."""
+
+        if value in self.__card_class.CASE_FUNCTIONS:
+            self.case_name = value
+            self.case = self.__card_class.CASE_FUNCTIONS[value]
+        else:
+            self.__error('case', value, 'unrecognized value')
+
+
+    def __parse_color(self, value: str) -> None:
+        """Parse the 'color' YAML attribute."""
+
+        self.color = value
+
+
+    def __parse_file(self, value: Path) -> None:
+        """Parse the 'file' YAML attribute."""
+
+        # Custom fonts use no replacements unless explicitly specified
+        reset_replacements = not self._is_specified('replacements')
+
+        # If specified as direct path, check for existance
+        if value.exists():
+            self.file = str(value.resolve())
+            if reset_replacements:
                 self.replacements = {}
-            # If specified indirectly (or DNE), glob for any extension
-            elif len(matches := tuple(value.parent.glob(f'{value.name}*'))) ==1:
-                self.file = str(matches[0].resolve())
+        # If specified indirectly (or DNE), glob for any extension
+        elif len(matches := tuple(value.parent.glob(f'{value.name}*'))) == 1:
+            self.file = str(matches[0].resolve())
+            if reset_replacements:
                 self.replacements = {}
-            else:
-                self.__error('file', value, 'no font file found')
-
-        # Replacements and delete_missing
-        if (value := self.get('replacements', type_=dict)) is not None:
-            # Convert each replacement to string, exit if impossible
-            self.delete_missing = bool(value.pop('delete_missing', True))
-            self.replacements = {}
-            for in_, out_ in value.items():
-                try:
-                    self.replacements[str(in_)] = str(out_)
-                except Exception:
-                    self.__error('replacements', value,
-                                f'bad replacement for "{in_}"')
-
-        # Size
-        if (value := self.get('size', type_=str)) is not None:
-            if bool(self._PERCENT_REGEX_POSITIVE.match(value)):
-                self.size = float(value[:-1]) / 100.0
-            else:
-                self.__error('size', value, 'specify as "x%')
-
-        # Vertical shift
-        if (value := self.get('vertical_shift', type_=int)) is not None:
-            if isinstance(value, int):
-                self.vertical_shift = value
-            else:
-                self.__error('vertical_shift', value, 'must be integer')
-
-        # Interline spacing
-        if (value := self.get('interline_spacing', type_=int)) is not None:
-            if isinstance(value, int):
-                self.interline_spacing = value
-            else:
-                self.__error('interline_spacing', value, 'must be integer')
-
-        # Interword spacing
-        if (value := self.get('interword_spacing', type_=int)) is not None:
-            if isinstance(value, int):
-                self.interword_spacing = value
-            else:
-                self.__error('interword_spacing', value, 'must be integer')
-
-        # Kerning
-        if (value := self.get('kerning', type_=str)) is not None:
-            if bool(self._PERCENT_REGEX.match(value)):
-                self.kerning = float(value[:-1]) / 100.0
-            else:
-                self.__error('kerning', value, 'specify as "x%"')
-
-        # Stroke width
-        if (value := self.get('stroke_width', type_=str)) is not None:
-            if bool(self._PERCENT_REGEX_POSITIVE.match(value)):
-                self.stroke_width = float(value[:-1]) / 100.0
-            else:
-                self.__error('stroke_width', value, 'specify as "x%"')
+        else:
+            self.__error('file', value, 'no font file found')
+
+
+    def __parse_replacements(self, value: dict) -> None:
+        """Parse the 'replacements' (and delete_missing) YAML attribute."""
+
+        # Convert each replacement to string, exit if impossible
+        self.delete_missing = bool(value.pop('delete_missing', True))
+        replacements = {}
+        for in_, out_ in value.items():
+            try:
+                replacements[str(in_)] = str(out_)
+            except Exception:
+                self.__error('replacements', value,
+                            f'bad replacement for "{in_}"')
+
+        self.replacements = replacements
+
+
+    def __parse_size(self, value: str) -> None:
+        """Parse the 'size' YAML attribute."""
+
+        if (size := self.__parse_percentage(value, positive=True)) is not None:
+            self.size = size
+        else:
+            self.__error('size', value, 'specify as "x%')
+
+
+    def __parse_integer(self, attribute: str, value: Any) -> Optional[int]:
+        """
+        Parse the given value of the given integer YAML attribute. YAML
+        booleans are rejected, while other values (e.g. "-20" from a
+        Template) are converted with int().
+
+        Args:
+            attribute: Font attribute being parsed (for logging).
+            value: Value of the attribute to parse.
+
+        Returns:
+            The parsed integer, None if the value is invalid.
+        """
+
+        # bool is a subclass of int, so int() would silently accept it
+        if isinstance(value, bool):
+            self.__error(attribute, value, 'must be integer')
+            return None
+
+        return self._convert(value, attribute, type_=int)
+
+
+    def __parse_vertical_shift(self, value: Any) -> None:
+        """Parse the 'vertical_shift' YAML attribute."""
+
+        shift = self.__parse_integer('vertical_shift', value)
+        if shift is not None:
+            self.vertical_shift = shift
+
+
+    def __parse_interline_spacing(self, value: Any) -> None:
+        """Parse the 'interline_spacing' YAML attribute."""
+
+        spacing = self.__parse_integer('interline_spacing', value)
+        if spacing is not None:
+            self.interline_spacing = spacing
+
+
+    def __parse_interword_spacing(self, value: Any) -> None:
+        """Parse the 'interword_spacing' YAML attribute."""
+
+        spacing = self.__parse_integer('interword_spacing', value)
+        if spacing is not None:
+            self.interword_spacing = spacing
+
+
+    def __parse_kerning(self, value: str) -> None:
+        """Parse the 'kerning' YAML attribute."""
+
+        if (kerning := self.__parse_percentage(value)) is not None:
+            self.kerning = kerning
+        else:
+            self.__error('kerning', value, 'specify as "x%"')
+
+
+    def __parse_stroke_width(self, value: str) -> None:
+        """Parse the 'stroke_width' YAML attribute."""
+
+        stroke_width = self.__parse_percentage(value, positive=True)
+        if stroke_width is not None:
+            self.stroke_width = stroke_width
+        else:
+            self.__error('stroke_width', value, 'specify as "x%"')
+
+
+    """Type and parsing function for each YAML attribute"""
+    __ATTRIBUTE_PARSERS: dict[str, tuple[Optional[Callable], Callable]] = {
+        'validate': (bool, __parse_validate),
+        'case': (YamlReader.TYPE_LOWER_STR, __parse_case),
+        'color': (str, __parse_color),
+        'file': (Path, __parse_file),
+        'replacements': (dict, __parse_replacements),
+        'size': (str, __parse_size),
+        'vertical_shift': (None, __parse_vertical_shift),
+        'interline_spacing': (None, __parse_interline_spacing),
+        'interword_spacing': (None, __parse_interword_spacing),
+        'kerning': (str, __parse_kerning),
+        'stroke_width': (str, __parse_stroke_width),
+    }
+
+
+    def __parse_attributes(self) -> None:
+        """Parse this object's YAML and update the validity and attributes."""
+
+        if not isinstance(self._base_yaml, dict):
+            return None
+
+        # Only parse the (non-blank) attributes actually present in the YAML
+        for attribute, value in self._base_yaml.items():
+            if (value is None
+                or (parser := self.__ATTRIBUTE_PARSERS.get(attribute)) is None):
+                continue
+
+            type_, parse_function = parser
+            value = self._convert(value, attribute, type_=type_)
+            if value is not None:
+                parse_function(self, value)
 
 
     def reset(self) -> None:
@@ -236,6 +379,28 @@ class Font(YamlReader):
         }
 
 
+    def apply_replacements(self, text: str) -> str:
+        """
+        Apply this font's replacements to the given text. Replacements
+        are applied in order, so the output of one replacement can be
+        replaced by any subsequent replacements.
+
+        Args:
+            text: The text to modify.
+
+        Returns:
+            The modified text.
+        """
+
+        if self.__translation_table is not None:
+            return text.translate(self.__translation_table)
+
+        for old, new in self.replacements.items():
+            text = text.replace(old, new)
+
+        return text
+
+
     def validate_title(self, title: str) -> tuple[str, bool]:
         """
         Return whether all the characters of the given title are valid
@@ -253,6 +418,10 @@ class Font(YamlReader):
             otherwise.
         """
 
+        # If not validating or deleting missing characters, skip validation
+        if not self.__validate and not self.delete_missing:
+            return title, True
+
         # Validate title against this font
         valid = self.__validator.validate_title(self.file, title)
 
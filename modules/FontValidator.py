@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from fontTools.ttLib import TTFont
 from tinydb import where
 
@@ -72,6 +74,33 @@ class FontValidator:
         return False
 
 
+    # Cache holds (and keys on) self, which is fine as only the single
+    # global FontValidator (global_objects.fv) is ever created
+    @lru_cache(maxsize=4096)
+    def __get_missing_title_characters(self,
+            font_filepath: str,
+            title: str,
+        ) -> tuple[str, ...]:
+        """
+        Get the characters of the given title that are missing from the
+        given Font. Results are cached, as the status of each character
+        within a font never changes.
+
+        Args:
+            font_filepath: Filepath to the font being validated against
+            title: The title being validated.
+
+        Returns:
+            Tuple of all characters (in order) of the title that are not
+            found within the given font.
+        """
+
+        return tuple(
+            char for char in title.replace('\n', '')
+            if not self.__has_character(font_filepath, char)
+        )
+
+
     def validate_title(self, font_filepath: str, title: str) -> bool:
         """
         Validate the given Title, returning whether all characters are
@@ -86,18 +115,12 @@ class FontValidator:
             given font, False otherwise.
         """
 
-        # Map __has_character() to all characters in the title
-        has_characters = tuple(map(
-            lambda char: self.__has_character(font_filepath, char),
-            (title := title.replace('\n', ''))
-        ))
-
         # Log all missing characters
-        for char, has_character in zip(title, has_characters):
-            if not has_character:
-                log.warning(f'Character "{char}" missing from "{font_filepath}"')
+        missing = self.__get_missing_title_characters(font_filepath, title)
+        for char in missing:
+            log.warning(f'Character "{char}" missing from "{font_filepath}"')
 
-        return all(has_characters)
+        return not missing
 
 
     def get_missing_characters(self, font_filepath: str) -> set[str]:
@@ -1,5 +1,6 @@
 from os import environ, name as os_name
 from pathlib import Path
+from re import compile as re_compile, escape as re_escape
 from shlex import split as command_split
 from subprocess import Popen, PIPE, TimeoutExpired
 from typing import Literal, NamedTuple, Optional, overload
@@ -41,6 +42,9 @@ class ImageMagickInterface:
 
     """Characters that must be escaped in commands"""
     __REQUIRED_ESCAPE_CHARACTERS = ('"', '`', '%', '\\')
+    __ESCAPE_CHARACTER_REGEX = re_compile(
+        f'[{"".join(map(re_escape, __REQUIRED_ESCAPE_CHARACTERS))}]'
+    )
 
     """Substrings that must be present in --version output"""
     __REQUIRED_VERSION_SUBSTRINGS = ('Version','Copyright','License','Features')
@@ -115,13 +119,22 @@ class ImageMagickInterface:
         if string is None:
             return None
 
+        # Most strings have no characters to escape, skip replacements
+        if ImageMagickInterface.__ESCAPE_CHARACTER_REGEX.search(string) is None:
+            return string
+
         for char in ImageMagickInterface.__REQUIRED_ESCAPE_CHARACTERS:
             string = string.replace(char, f'\{char}')
 
         return string
 
 
-    def run(self, command: str) -> tuple[bytes, bytes]:
+    def run(self,
+            command: str,
+            *,
+            input_file: Optional[Path] = None,
+            output_file: Optional[Path] = None,
+        ) -> tuple[bytes, bytes]:
         """
         Wrapper for running a given command. This uses either the host
         machine (i.e. direct calls); or through the provided docker
@@ -130,6 +143,12 @@ class ImageMagickInterface:
 
         Args:
             command: The command (as string) to execute.
+            input_file: (Keyword only) File to pass directly after the
+                command name (e.g. convert). This is passed as a single
+                argument, so it does not need to be quoted or escaped.
+            output_file: (Keyword only) File to pass as the final
+                argument of the command. This is passed as a single
+                argument, so it does not need to be quoted or escaped.
 
         Returns:
             Tuple of the STDOUT and STDERR of the executed command.
@@ -142,18 +161,29 @@ class ImageMagickInterface:
         # If a docker image ID is specified, execute the command in that container
         # otherwise, execute on the host machine (no docker wrapper)
         if self.use_docker:
-            command = f'docker exec -t {self.container} {self.prefix}{command}'
+            prefix = f'docker exec -t {self.container} {self.prefix}'
         else:
-            command = f'{self.prefix}{command}'
+            prefix = self.prefix
 
         # Split command into list of strings for Popen
         try:
-            cmd = command_split(command)
+            prefix_length = len(command_split(prefix))
+            cmd = command_split(f'{prefix}{command}')
         except ValueError as exc:
             log.exception(f'Invalid ImageMagick command', exc)
-            log.debug(command)
+            log.debug(f'{prefix}{command}')
             return b'', b''
 
+        # Add files as their own arguments, quote them only for logging
+        if input_file is not None:
+            cmd.insert(prefix_length + 1, str(input_file.resolve()))
+            name, _, command = command.partition(' ')
+            command = f'{name} "{cmd[prefix_length + 1]}" {command}'
+        if output_file is not None:
+            cmd.append(str(output_file.resolve()))
+            command = f'{command} "{cmd[-1]}"'
+        command = f'{prefix}{command}'
+
         # Execute, capturing stdout and stderr
         stdout, stderr = b'', b''
         try:
@@ -406,8 +406,4 @@ class Profile:
             cased_title = self.font.case(title_text)
 
         # Apply font replacements
-        replaced_title = cased_title
-        for old, new in self.font.replacements.items():
-            replaced_title = replaced_title.replace(old, new)
-
-        return replaced_title
+        return self.font.apply_replacements(cased_title)
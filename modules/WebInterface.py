@@ -1,8 +1,9 @@
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Union
 
 from re import IGNORECASE, compile as re_compile
-from requests import get, Session
+from requests import Session
 from tenacity import retry, stop_after_attempt, wait_fixed, wait_exponential
 import urllib3
 
@@ -25,6 +26,9 @@ class WebInterface:
     """Regex to match URL's"""
     _URL_REGEX = re_compile(r'^((?:https?:\/\/)?.+)(?=\/)', IGNORECASE)
 
+    """Session shared by all image downloads to reuse connections"""
+    _DOWNLOAD_SESSION = Session()
+
     """Content to ignore if returned by any GET request"""
     BAD_CONTENT = (
         b'<html><head><title>',
@@ -39,7 +43,7 @@ class WebInterface:
         ) -> None:
         """
         Construct a new instance of a WebInterface. This creates creates
-        cached request and results lists, and establishes a session for
+        a cache of requests and results, and establishes a session for
         future use.
 
         Args:
@@ -64,8 +68,7 @@ class WebInterface:
 
         # Cache of the last requests to speed up identical sequential requests
         self.__do_cache = cache
-        self.__cache = []
-        self.__cached_results = []
+        self.__cache = OrderedDict()
 
 
     def __repr__(self) -> str:
@@ -116,23 +119,27 @@ class WebInterface:
         if not self.__do_cache:
             return self.__retry_get(url=url, params=params)
 
-        # Look through all cached results for this exact URL+params; if found,
-        # skip the request and return that result
-        for cache, result in zip(self.__cache, self.__cached_results):
-            if cache['url'] == url and cache['params'] == str(params):
-                return result
+        # Key the cache on this exact URL+params; if unhashable, skip cache
+        key = (url, tuple(sorted(params.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return self.__retry_get(url=url, params=params)
+
+        # If this request has been cached, skip the request and return that
+        if key in self.__cache:
+            self.__cache.move_to_end(key)
+            return self.__cache[key]
 
         # Make new request, add to cache
-        self.__cached_results.append(self.__retry_get(url=url, params=params))
-        self.__cache.append({'url': url, 'params': str(params)})
+        result = self.__cache[key] = self.__retry_get(url=url, params=params)
 
-        # Delete element from cache if length has been exceeded
+        # Delete oldest element from cache if length has been exceeded
         if len(self.__cache) > self.CACHE_LENGTH:
-            self.__cache.pop(0)
-            self.__cached_results.pop(0)
+            self.__cache.popitem(last=False)
 
         # Return latest result
-        return self.__cached_results[-1]
+        return result
 
 
     @staticmethod
@@ -160,7 +167,9 @@ class WebInterface:
         # Attempt to download the image, if an error happens log to user
         try:
             # Get content from URL
-            image = get(image, timeout=30).content
+            image = WebInterface._DOWNLOAD_SESSION.get(
+                image, timeout=30,
+            ).content
             if len(image) == 0:
                 raise ValueError(f'URL {image} returned no content error')
             if any(bad_content in image for bad_content in WebInterface.BAD_CONTENT):
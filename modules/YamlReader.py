@@ -79,22 +79,48 @@ class YamlReader:
             for attrib in attributes:
                 value = value[attrib]
 
-            # If no type conversion is indicated, just return value
-            if type_ is None:
-                return value
+            return self._convert(value, *attributes, type_=type_,
+                                 default=default)
 
-            try:
-                # Attempt type conversion
-                return type_(value)
-            except Exception as e:
-                # Type conversion failed, log, set invalid, return None
-                attrib_string = '", "'.join(attributes)
-                self.__log(f'Value of "{attrib_string}" is invalid - {e}')
-                self.valid = False
+        # No value specified, return default
+        return default
+
+
+    def _convert(self,
+            value: Any,
+            *attributes: str,
+            type_: Optional[Callable] = None,
+            default: Any = None,
+        ) -> Any:
+        """
+        Convert the given value of the given attributes to the given
+        type. Log invalidity and return the default if the value cannot
+        be converted.
+
+        Args:
+            value: Value to convert.
+            attributes: Attributes the value is located at (for logging).
+            type_: Optional callable (i.e. type) to call on the value.
+            default: Default value to return if conversion fails.
+
+        Returns:
+            Converted value, value of default if the value cannot be
+            converted to the given type.
+        """
+
+        # If no type conversion is indicated, just return value
+        if type_ is None:
+            return value
+
+        try:
+            # Attempt type conversion
+            return type_(value)
+        except Exception as e:
+            # Type conversion failed, log, set invalid, return default
+            attrib_string = '", "'.join(attributes)
+            self.__log(f'Value of "{attrib_string}" is invalid - {e}')
+            self.valid = False
 
-                return default
-        else:
-            # No value specified, return None
             return default
 
 
@@ -33,10 +33,14 @@ class OverlineTitleCard(BaseCardType):
     DEFAULT_FONT_CASE = 'upper'
     FONT_REPLACEMENTS = {}
 
+    """Default font attributes, ordered as compared in is_custom_font"""
+    __DEFAULT_FONT_ATTRIBUTES = (TITLE_COLOR, 1.0, TITLE_FONT, 0, 0, 1.0, 0)
+
     """Characteristics of the episode text"""
     EPISODE_TEXT_COLOR = TITLE_COLOR
-    EPISODE_TEXT_FONT = (
-        BaseCardType.BASE_REF_DIRECTORY / 'Proxima Nova Semibold.otf'
+    __EPISODE_TEXT_FORMAT_UPPER = BaseCardType.EPISODE_TEXT_FORMAT.upper()
+    EPISODE_TEXT_FONT = str(
+        (BaseCardType.BASE_REF_DIRECTORY / 'Proxima Nova Semibold.otf').resolve()
     )
 
     """Whether this CardType uses season titles for archival purposes"""
@@ -49,7 +53,7 @@ class OverlineTitleCard(BaseCardType):
     LINE_THICKNESS = 7
 
     """Gradient to overlay"""
-    GRADIENT_IMAGE = REF_DIRECTORY / 'small_gradient.png'
+    GRADIENT_IMAGE = str((REF_DIRECTORY / 'small_gradient.png').resolve())
 
     __slots__ = (
         'source_file', 'output_file', 'title_text', 'season_text',
@@ -58,6 +62,10 @@ class OverlineTitleCard(BaseCardType):
         'font_interword_spacing', 'font_kerning', 'font_stroke_width',
         'font_vertical_shift', 'episode_text_color', 'line_color', 'hide_line',
         'line_position', 'line_width', 'omit_gradient', 'separator',
+        '__title_vertical_position', '__title_interline_spacing',
+        '__title_size', '__title_kerning', '__title_stroke_width',
+        '__title_interword_spacing', '__index_vertical_shift', '__line_top',
+        '__line_bottom',
     )
 
     def __init__(self, *,
@@ -122,6 +130,28 @@ class OverlineTitleCard(BaseCardType):
         self.omit_gradient = omit_gradient
         self.separator = separator
 
+        # Text and line positioning is based on where the line is
+        if line_position == 'top':
+            self.__title_vertical_position = font_vertical_shift + 70
+            self.__title_interline_spacing = 25 + font_interline_spacing
+            self.__index_vertical_shift = font_vertical_shift + 232
+            line_center = self.HEIGHT - (font_vertical_shift + 265)
+        else:
+            self.__title_vertical_position = font_vertical_shift + 110
+            self.__title_interline_spacing = -25 + font_interline_spacing
+            self.__index_vertical_shift = font_vertical_shift + 65
+            line_center = self.HEIGHT - (font_vertical_shift + 98)
+
+        # Vertical bounds of the line
+        self.__line_top = line_center - (line_width / 2)
+        self.__line_bottom = line_center + (line_width / 2)
+
+        # Title font characteristics
+        self.__title_size = 55 * font_size
+        self.__title_interword_spacing = 50 + font_interword_spacing
+        self.__title_kerning = -2 * font_kerning
+        self.__title_stroke_width = 5 * font_stroke_width
+
 
     @property
     def gradient_commands(self) -> ImageMagickCommands:
@@ -131,7 +161,7 @@ class OverlineTitleCard(BaseCardType):
             return []
 
         return [
-            f'"{self.GRADIENT_IMAGE.resolve()}"',
+            f'"{self.GRADIENT_IMAGE}"',
             f'-composite',
         ]
 
@@ -144,37 +174,18 @@ class OverlineTitleCard(BaseCardType):
         if len(self.title_text) == 0:
             return []
 
-        # Position of the text is based on where the line is
-        vertical_position = self.font_vertical_shift
-        if self.line_position == 'top':
-            vertical_position += 70
-        else:
-            vertical_position += 110
-
-        # Use increased interline spacing for top line positioning
-        if self.line_position == 'top':
-            interline_spacing =  25 + self.font_interline_spacing
-        else:
-            interline_spacing = -25 + self.font_interline_spacing
-
-        # Font characteristics
-        size = 55 * self.font_size
-        interword_spacing = 50 + self.font_interword_spacing
-        kerning = -2 * self.font_kerning
-        stroke_width = 5 * self.font_stroke_width
-
         return [
             f'-density 200',
             f'-gravity south',
             f'-font "{self.font_file}"',
             f'-fill "{self.font_color}"',
-            f'-pointsize {size}',
-            f'-strokewidth {stroke_width}',
+            f'-pointsize {self.__title_size}',
+            f'-strokewidth {self.__title_stroke_width}',
             f'-stroke black',
-            f'-kerning {kerning}',
-            f'-interline-spacing {interline_spacing}',
-            f'-interword-spacing {interword_spacing}',
-            f'-annotate +0+{vertical_position} "{self.title_text}"',
+            f'-kerning {self.__title_kerning}',
+            f'-interline-spacing {self.__title_interline_spacing}',
+            f'-interword-spacing {self.__title_interword_spacing}',
+            f'-annotate +0+{self.__title_vertical_position} "{self.title_text}"',
         ]
 
 
@@ -194,22 +205,14 @@ class OverlineTitleCard(BaseCardType):
         else:
             index_text = f'{self.season_text} {self.separator} {self.episode_text}'
 
-        # Determine vertical position based on which element this text is
-        vertical_shift = self.font_vertical_shift
-        if self.line_position == 'top':
-            vertical_shift += 232
-        else:
-            vertical_shift += 65
-
         return [
             f'-density 200',
-            # f'-font "{self.EPISODE_TEXT_FONT.resolve()}"',
-            f'-font "{self.REF_DIRECTORY.parent / "Proxima Nova Semibold.otf"}"',
+            f'-font "{self.EPISODE_TEXT_FONT}"',
             f'-fill "{self.episode_text_color}"',
             f'-strokewidth 2',
             f'-pointsize 22',
             f'-interword-spacing 18',
-            f'-annotate +0+{vertical_shift} "{index_text}"'
+            f'-annotate +0+{self.__index_vertical_shift} "{index_text}"'
         ]
 
 
@@ -232,50 +235,28 @@ class OverlineTitleCard(BaseCardType):
         if self.hide_line:
             return []
 
-        # Determine starting vertical offset of the lines
-        vertical_position = self.font_vertical_shift
-        if self.line_position == 'top':
-            vertical_position += 265
-        else:
-            vertical_position += 98
-        vertical_position = self.HEIGHT - vertical_position
+        # Horizontal and vertical bounds of the lines
+        half_width = self.WIDTH / 2
+        half_title_width = title_text_dimensions.width / 2
+        half_index_width = index_text_dimensions.width / 2
+        top, bottom = self.__line_top, self.__line_bottom
 
         # If index text is gone, draw singular rectangle
         if self.hide_season_text and self.hide_episode_text:
             right_rectangle = Rectangle(Coordinate(0, 0), Coordinate(0, 0))
             left_rectangle = Rectangle(
-                Coordinate(
-                    (self.WIDTH / 2) - (title_text_dimensions.width / 2) + 30,
-                    vertical_position - (self.line_width / 2)
-                ),
-                Coordinate(
-                    (self.WIDTH / 2) + (title_text_dimensions.width / 2) - 30,
-                    vertical_position + (self.line_width / 2),
-                )
+                Coordinate(half_width - half_title_width + 30, top),
+                Coordinate(half_width + half_title_width - 30, bottom),
             )
         else:
-            # Create left rectangle
+            # Create left and right rectangles
             left_rectangle = Rectangle(
-                Coordinate(
-                    (self.WIDTH / 2) - (title_text_dimensions.width / 2) + 30,
-                    vertical_position - (self.line_width / 2),
-                ),
-                Coordinate(
-                    (self.WIDTH / 2) - (index_text_dimensions.width / 2),
-                    vertical_position + (self.line_width / 2),
-                )
+                Coordinate(half_width - half_title_width + 30, top),
+                Coordinate(half_width - half_index_width, bottom),
             )
-
-            # Create right rectangle
             right_rectangle = Rectangle(
-                Coordinate(
-                    (self.WIDTH / 2) + (index_text_dimensions.width / 2),
-                    vertical_position - (self.line_width / 2),
-                ),
-                Coordinate(
-                    (self.WIDTH / 2) + (title_text_dimensions.width / 2) - 30,
-                    vertical_position + (self.line_width / 2),
-                )
+                Coordinate(half_width + half_index_width, top),
+                Coordinate(half_width + half_title_width - 30, bottom),
             )
 
             # Draw nothing if either rectangle would invert or is too short
@@ -341,13 +322,9 @@ class OverlineTitleCard(BaseCardType):
         )
 
         return (custom_extras
-            or ((font.color != OverlineTitleCard.TITLE_COLOR)
-            or (font.file != OverlineTitleCard.TITLE_FONT)
-            or (font.interline_spacing != 0)
-            or (font.interword_spacing != 0)
-            or (font.kerning != 1.0)
-            or (font.size != 1.0)
-            or (font.vertical_shift != 0))
+            or (font.color, font.size, font.file, font.interline_spacing,
+                font.interword_spacing, font.kerning, font.vertical_shift)
+                != OverlineTitleCard.__DEFAULT_FONT_ATTRIBUTES
         )
 
 
@@ -368,10 +345,9 @@ class OverlineTitleCard(BaseCardType):
             True if custom season titles are indicated, False otherwise.
         """
 
-        standard_etf = OverlineTitleCard.EPISODE_TEXT_FORMAT.upper()
-
         return (custom_episode_map
-                or episode_text_format.upper() != standard_etf)
+                or episode_text_format.upper()
+                    != OverlineTitleCard.__EPISODE_TEXT_FORMAT_UPPER)
 
 
     def create(self) -> None:
@@ -380,28 +356,39 @@ class OverlineTitleCard(BaseCardType):
         object's defined title card.
         """
 
-        # Get the dimensions of the title and index text
-        title_text_dimensions = self.get_text_dimensions(
-            self.title_text_commands, width='max', height='sum',
-        )
-        index_text_dimensions = self.get_text_dimensions(
-            self.index_text_commands, width='max', height='sum',
-        )
+        # Generate the title and index text commands once, reuse for both
+        # the text dimensions and the final command
+        title_text_commands = self.title_text_commands
+        index_text_commands = self.index_text_commands
+
+        # Get the dimensions of the title and index text - these are only
+        # used to size the line, so skip the extra ImageMagick processes if
+        # the line is hidden
+        if self.hide_line:
+            title_text_dimensions = index_text_dimensions = Dimensions(0, 0)
+        else:
+            title_text_dimensions = self.get_text_dimensions(
+                title_text_commands, width='max', height='sum',
+            )
+            index_text_dimensions = self.get_text_dimensions(
+                index_text_commands, width='max', height='sum',
+            )
 
         command = ' '.join([
-            f'convert "{self.source_file.resolve()}"',
+            'convert',
             # Resize and apply styles to source image
             *self.resize_and_style,
             # Add gradient overlay
             *self.gradient_commands,
             # Add text
-            *self.title_text_commands,
-            *self.index_text_commands,
+            *title_text_commands,
+            *index_text_commands,
             # Add line
             *self.line_commands(title_text_dimensions, index_text_dimensions),
             # Create card
             *self.resize_output,
-            f'"{self.output_file.resolve()}"',
         ])
 
-        self.image_magick.run(command)
+        self.image_magick.run(
+            command, input_file=self.source_file, output_file=self.output_file,
+        )